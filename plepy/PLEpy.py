@@ -1,17 +1,52 @@
 import json
+import math
 import numpy as np
 import copy
+import weakref
 from plepy.helper import recur_to_json
 from pyomo.dae import *
 from pyomo.environ import *
 # TODO: fix, so not using import *
 
+# per-model cache of resolved components, so repeated PLEpy construction
+# on the same model (bootstrap or Monte Carlo sweeps) walks the model
+# tree once per name; weak keys let dropped models be collected instead
+# of pinning them here (resamples that rebuild the model never pay for
+# the cache). Assumes components are not deleted and re-added under the
+# same name on a live model.
+_component_cache = weakref.WeakKeyDictionary()
+
+
+def _find_component(model, cname):
+    try:
+        mcache = _component_cache[model]
+    except KeyError:
+        mcache = _component_cache[model] = {}
+    if cname not in mcache:
+        mcache[cname] = model.find_component(cname)
+    return mcache[cname]
+
 
 class PLEpy:
 
+    # solver defaults shared by every instance; overridden per instance
+    # by solver_kwds
+    _default_solver_opts = {
+        'linear_solver': 'ma97',
+        'tol': 1e-6
+    }
+
+    # ipopt options applied only to warm-started solves (see m_eval)
+    _warmstart_opts = {
+        'warm_start_init_point': 'yes',
+        'warm_start_bound_push': 1e-9,
+        'warm_start_mult_bound_push': 1e-9,
+        'mu_init': 1e-6
+    }
+
     def __init__(self, model, pnames: list, indices=None, solver='ipopt',
                  solver_kwds={}, tee=False, dae=None, dae_kwds={},
-                 presolve=False):
+                 presolve=False, warmstart=True):
         """Profile Likelihood Estimator object
         
         Args
@@ -38,18 +73,44 @@ class PLEpy:
             keywords for dae package, by default {}
         presolve : bool, optional
             if True, model needs to be solved first, by default False
+        warmstart : bool, optional
+            if True (and solver is ipopt), the sequential profiling
+            solves in get_PL are warm-started from the previously
+            loaded solution, passing bound multipliers back to ipopt
+            through its suffixes; the bisection solves in bsearch
+            always start cold, by default True
         """
         # Define solver & options
-        solver_opts = {
-            'linear_solver': 'ma97',
-            'tol': 1e-6
-        }
-        solver_opts = {**solver_opts, **solver_kwds}
+        solver_opts = dict(self._default_solver_opts)
+        solver_opts.update(solver_kwds)
         opt = SolverFactory(solver)
         opt.options = solver_opts
         self.solver = opt
+        self.sname = solver
+        # warm starts are ipopt-specific and only applied to the small
+        # sequential steps of get_PL (see m_eval); don't manage options
+        # the user set explicitly through solver_kwds
+        self.warmstart = warmstart and solver == 'ipopt'
+        self._wsopts = {k: v for k, v in self._warmstart_opts.items()
+                        if k not in solver_kwds}
+        self._warm = False
+        # cache of chi2 quantiles keyed by alpha (see get_clevel)
+        self._etol_cache = {}
 
         self.m = model
+        if self.warmstart:
+            # declare the suffixes ipopt uses to exchange multiplier
+            # information; without them a warm start would be primal-only
+            if self.m.find_component('dual') is None:
+                self.m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+            if self.m.find_component('ipopt_zL_out') is None:
+                self.m.ipopt_zL_out = Suffix(direction=Suffix.IMPORT)
+            if self.m.find_component('ipopt_zU_out') is None:
+                self.m.ipopt_zU_out = Suffix(direction=Suffix.IMPORT)
+            if self.m.find_component('ipopt_zL_in') is None:
+                self.m.ipopt_zL_in = Suffix(direction=Suffix.EXPORT)
+            if self.m.find_component('ipopt_zU_in') is None:
+                self.m.ipopt_zU_in = Suffix(direction=Suffix.EXPORT)
         # Discretize and solve model if necessary
         if dae and presolve:
             assert isinstance(dae, str)
@@ -65,8 +126,11 @@ class PLEpy:
         self.indices = indices
         m_items = self.m.component_objects()
         m_obj = list(filter(lambda x: isinstance(x, Objective), m_items))[0]
+        # keep a direct reference to the objective component so hot loops
+        # don't re-look it up by attribute name on every solve
+        self.m_obj = m_obj
         self.obj = value(m_obj)    # original objective value
-        pprofile = {p: self.m.find_component(p) for p in self.pnames}
+        pprofile = {p: _find_component(self.m, p) for p in self.pnames}
         # list of Pyomo Variable objects to be profiled
         self.plist = pprofile
         # determine which variables are indexed
@@ -113,10 +177,15 @@ class PLEpy:
             self.plist[pname].set_value(val)
 
     def get_clevel(self, alpha: float=0.05):
-        # determine confidence threshold value
-        from scipy.stats.distributions import chi2
-        etol = chi2.isf(alpha, df=1)
-        clevel = etol/2 + np.log(self.obj)
+        # determine confidence threshold value, caching the chi2 quantile so
+        # repeated calls with the same alpha skip the SciPy dispatch
+        if alpha not in self._etol_cache:
+            # chdtri(1, alpha) == chi2.isf(alpha, df=1) without going
+            # through the scipy.stats distribution-object machinery
+            from scipy.special import chdtri
+            self._etol_cache[alpha] = float(chdtri(1, alpha))
+        etol = self._etol_cache[alpha]
+        clevel = etol/2 + math.log(self.obj)
         self.clevel = clevel
         return clevel
 
@@ -154,6 +223,9 @@ class PLEpy:
         def inner_loop(xopt, xb, direct=1, idx=None) -> dict:
             from plepy.helper import sflag
 
+            # each sweep starts at its own far point, so its first solve
+            # must not warm-start from the other end of the profile
+            self._warm = False
             pdict = {}
             if direct:
                 print('Going up...')
@@ -176,45 +248,46 @@ class PLEpy:
                     rx = self.m_eval(pname, x, idx=idx, reset=False)
                     xdict['flag'] = sflag(rx)
                     self.m.solutions.load_from(rx)
-                    xdict['obj'] = np.log(value(self.m.obj))
+                    xdict['obj'] = math.log(value(self.m_obj))
                     # store values of other parameters at each point
                     for p in self.pnames:
                         xdict[p] = self.getval(p)
                 except ValueError:
+                    # no previous point to fall back on at the optimum
+                    if w == 0:
+                        raise
                     xdict = copy.deepcopy(pdict[x0[w-1]])
                 pdict[x] = xdict
-            if direct:
-                x_out = x0[1:]
-                x_in = x0[:-1]
-            else:
-                x_out = x0[:-1]
-                x_in = x0[1:]
+            # x0 is sorted ascending regardless of direction, so adjacent
+            # intervals are x0[:-1] -> x0[1:] with positive step sizes
+            x_out = x0[1:]
+            x_in = x0[:-1]
             # calculate magnitude of step sizes
             dx = x_out - x_in
+            # objective values are carried in an array parallel to x0 from
+            # here on, rather than re-read from pdict each pass
             y0 = np.array([pdict[x]['obj'] for x in x0])
             print('y0:', y0)
-            if direct:
-                y_out = y0[1:]
-                y_in = y0[:-1]
-            else:
-                y_out = y0[:-1]
-                y_in = y0[1:]
+            y_out = y0[1:]
+            y_in = y0[:-1]
             # calculate magnitude of objective value changes between each step
             dy = np.abs(y_out - y_in)
-            # pull indices where objective value change is greater than
+            # pull intervals where objective value change is greater than
             # threshold value (dtol) and step size is greater than minimum
-            ierr = [(i > dtol and j > min_step)
-                             for i, j in zip(dy, dx)]
+            ierr = (dy > dtol) & (dx > min_step)
             print('ierr:', ierr)
             itr = 0
             # For intervals of large change (above dtol), calculate values at
             # midpoint. Repeat until no large changes or minimum step size
             # reached.
-            while len(ierr) != 0:
+            while ierr.any():
                 print('iter: %i' % (itr))
-                x_oerr = np.array([j for i, j in zip(ierr, x_out) if i])
-                x_ierr = np.array([j for i, j in zip(ierr, x_in) if i])
+                x_oerr = x_out[ierr]
+                x_ierr = x_in[ierr]
+                y_oerr = y_out[ierr]
+                y_ierr = y_in[ierr]
                 x_mid = 0.5*(x_oerr + x_ierr)
+                y_mid = np.empty_like(x_mid)
                 for w, x in enumerate(x_mid):
                     xdict = {}
                     for p in self.pnames:
@@ -224,31 +297,35 @@ class PLEpy:
                         rx = self.m_eval(pname, x, idx=idx, reset=False)
                         xdict['flag'] = sflag(rx)
                         self.m.solutions.load_from(rx)
-                        xdict['obj'] = np.log(value(self.m.obj))
+                        xdict['obj'] = math.log(value(self.m_obj))
                         # store values of other parameters at each point
                         for p in self.pnames:
                             xdict[p] = self.getval(p)
                     except ValueError:
                         xdict = copy.deepcopy(pdict[x_ierr[w]])
                     pdict[x] = xdict
+                    y_mid[w] = xdict['obj']
                 # get all parameter values involved in intervals of interest
-                x0 = np.array(sorted(set([*x_oerr, *x_mid, *x_ierr])))
+                # (np.unique sorts and drops the endpoints shared between
+                # adjacent intervals), keeping objective values alongside
+                x_all = np.concatenate((x_ierr, x_mid, x_oerr))
+                y_all = np.concatenate((y_ierr, y_mid, y_oerr))
+                x0, iu = np.unique(x_all, return_index=True)
+                y0 = y_all[iu]
                 print('x0:', x0)
+                print('y0:', y0)
                 x_out = x0[1:]
                 x_in = x0[:-1]
                 # calculate magnitude of step sizes
                 dx = x_out - x_in
-                y0 = np.array([pdict[x]['obj'] for x in x0])
-                print('y0:', y0)
                 y_out = y0[1:]
                 y_in = y0[:-1]
                 # calculate magnitude of objective value change between each
                 # step
                 dy = np.abs(y_out - y_in)
-                # pull indices where objective value change is greater than
+                # pull intervals where objective value change is greater than
                 # threshold value (dtol) and step size is greater than minimum
-                ierr = [(i > dtol and j > min_step)
-                                 for i, j in zip(dy, dx)]
+                ierr = (dy > dtol) & (dx > min_step)
                 print('ierr:', ierr)
                 itr += 1
             return pdict
@@ -280,9 +357,10 @@ class PLEpy:
                     xlb = self.parlb[pname][k]
                     xub = self.parub[pname][k]
                     print('xopt: ', xopt, 'xlb: ', xlb, 'xub: ', xub)
-                    kPLup = inner_loop(xopt, xub, direct=1, idx=k)
-                    kPLdn = inner_loop(xopt, xlb, direct=0, idx=k)
-                    kPL = {**kPLup, **kPLdn}
+                    kPL = inner_loop(xopt, xub, direct=1, idx=k)
+                    # merge downward profile in place instead of building
+                    # a third dict
+                    kPL.update(inner_loop(xopt, xlb, direct=0, idx=k))
                     parPL[k] = kPL
                     self.plist[pname][k].free()
                 PLdict[pname] = parPL
@@ -291,11 +369,10 @@ class PLEpy:
                 xopt = self.popt[pname]
                 xlb = self.parlb[pname]
                 xub = self.parub[pname]
-                # discretize each half separately
-                parPLup = inner_loop(xopt, xub, direct=1)
-                parPLdn = inner_loop(xopt, xlb, direct=0)
-                # combine results into parameter profile likelihood
-                parPL = {**parPLup, **parPLdn}
+                # discretize each half separately, merging the downward
+                # profile into the upward one in place
+                parPL = inner_loop(xopt, xub, direct=1)
+                parPL.update(inner_loop(xopt, xlb, direct=0))
                 PLdict[pname] = parPL
                 self.plist[pname].free()
         self.PLdict = PLdict
@@ -313,6 +390,14 @@ class PLEpy:
         figs, axs = plot_PL(jdict, self.clevel, **kwds)
         return figs, axs
 
+    def ebarplots(self, **kwds):
+        from plepy.helper import ebarplots
+
+        assert isinstance(self.parlb, dict)
+        assert isinstance(self.parub, dict)
+        fig, axs = ebarplots(self.popt, self.parlb, self.parub, **kwds)
+        return fig, axs
+
     def m_eval(self, pname: str, pardr, idx=None, reset=True):
         # initialize all parameters at their optimal value (ensure feasibility)
         if reset:
@@ -325,12 +410,40 @@ class PLEpy:
         # if parameter is unindexed, set value of parameter to pardr
         else:
             self.plist[pname].set_value(pardr)
+        # get_PL's profiling loops pass reset=False and move one parameter
+        # slightly between solves, so those solves are warm-started from
+        # the previous loaded solution; bsearch's bisection jumps half the
+        # remaining bracket per solve, so those start from ipopt's default
+        # initialization
+        if self.warmstart and not reset and self._warm:
+            self.solver.options.update(self._wsopts)
+            # hand the previous solve's bound multipliers back to ipopt
+            self.m.ipopt_zL_in.update(self.m.ipopt_zL_out)
+            self.m.ipopt_zU_in.update(self.m.ipopt_zU_out)
+        else:
+            for k in self._wsopts:
+                self.solver.options.pop(k, None)
         # evalutate model at this point
-        return self.solver.solve(self.m)
+        results = self.solver.solve(self.m)
+        # the solution loaded from a profiling solve can seed the next
+        # sequential step
+        if self.warmstart:
+            self._warm = not reset
+        return results
 
     def bsearch(self, pname: str, clevel: float, acc: int,
                 direct: int=1, idx=None) -> float:
         """Binary search for confidence limit
+
+        Rather than walking the parameter outward in fixed steps (one
+        solve per step), this brackets the confidence limit in two
+        phases: first a bisection between the optimum and the parameter
+        bound to find the outermost feasible point above the threshold,
+        then a bisection within that bracket until the limit is pinned
+        down to 'acc' significant figures. Solve count is logarithmic in
+        the requested accuracy, and each IPOPT solve is the dominant
+        cost.
+
         Args
         ----
         pname : str
@@ -365,22 +478,19 @@ class PLEpy:
             x_out = float(self.pbounds[pname][idx][direct])
             x_in = float(self.popt[pname][idx])
 
-        # Initialize values based on direction
+        # Initialize values based on direction. The search itself is
+        # direction-free: it only ever needs the outer/inner pair, so the
+        # direction is not re-checked inside the loops below.
         x_mid = x_out
         # for upper CI search
         if direct:
-            x_high = x_out
-            x_low = x_in
             plc = 'upper'
             puc = 'Upper'
-            no_lim = float(x_out)
         # for lower CI search
         else:
-            x_high = x_in
-            x_low = x_out
             plc = 'lower'
             puc = 'Lower'
-            no_lim = float(x_out)
+        no_lim = float(x_out)
         
         # Print search info
         print(' '*80)
@@ -391,14 +501,14 @@ class PLEpy:
         print(' '*80)
 
         # check convergence criteria
-        ctol = sigfig(x_high, acc) - sigfig(x_low, acc)
+        ctol = abs(sigfig(x_out, acc) - sigfig(x_in, acc))
 
         # Find outermost feasible value
         # evaluate at outer bound
         r_mid = self.m_eval(pname, x_mid, idx=idx)
         fcheck = sflag(r_mid)
         self.m.solutions.load_from(r_mid)
-        err = np.log(value(self.m.obj))
+        err = math.log(value(self.m_obj))
         # If solution is feasible and the error is less than the value at the
         # confidence limit, there is no CI in that direction. Set to bound.
         if fcheck == 0 and err < clevel:
@@ -409,29 +519,23 @@ class PLEpy:
             # If solution is infeasible, find a new value for x_out that is
             # feasible and above the confidence limit threshold.
             while (fcheck == 1 or err < clevel) and ctol > 0.0:
-                print('f_iter: %i, x_high: %f, x_low: %f'
-                        % (fiter, x_high, x_low))
+                print('f_iter: %i, x_out: %f, x_in: %f'
+                        % (fiter, x_out, x_in))
                 # check convergence criteria
-                ctol = sigfig(x_high, acc) - sigfig(x_low, acc)
+                ctol = abs(sigfig(x_out, acc) - sigfig(x_in, acc))
                 # evaluate at midpoint
-                x_mid = 0.5*(x_high + x_low)
+                x_mid = 0.5*(x_out + x_in)
                 r_mid = self.m_eval(pname, x_mid, idx)
                 fcheck = sflag(r_mid)
                 # if infeasible, continue search inward from current midpoint
                 if fcheck == 1:
                     x_out = float(x_mid)
                 self.m.solutions.load_from(r_mid)
-                err = np.log(value(self.m.obj))
+                err = math.log(value(self.m_obj))
                 # if feasbile, but not over CL threshold, continue search
                 # outward from current midpoint
                 if fcheck == 0 and err < clevel:
                     x_in = float(x_mid)
-                if direct:
-                    x_high = x_out
-                    x_low = x_in
-                else:
-                    x_high = x_in
-                    x_low = x_out
                 fiter += 1
             # if convergence reached, there is no upper CI
             if ctol == 0.0:
@@ -441,25 +545,19 @@ class PLEpy:
             # optimal solution using binary search
             else:
                 x_out = float(x_mid)
-                if direct:
-                    x_high = x_out
-                    x_low = x_in
-                else:
-                    x_high = x_in
-                    x_low = x_out
                 biter = 0
-                # repeat until convergence criteria is met (x_high = x_low)
+                # repeat until convergence criteria is met (x_out = x_in)
                 while ctol > 0.0:
-                    print('b_iter: %i, x_high: %f, x_low: %f'
-                            % (biter, x_high, x_low))
+                    print('b_iter: %i, x_out: %f, x_in: %f'
+                            % (biter, x_out, x_in))
                     # check convergence criteria
-                    ctol = sigfig(x_high, acc) - sigfig(x_low, acc)
+                    ctol = abs(sigfig(x_out, acc) - sigfig(x_in, acc))
                     # evaluate at midpoint
-                    x_mid = 0.5*(x_high + x_low)
+                    x_mid = 0.5*(x_out + x_in)
                     r_mid = self.m_eval(pname, x_mid, idx=idx)
                     fcheck = sflag(r_mid)
                     self.m.solutions.load_from(r_mid)
-                    err = np.log(value(self.m.obj))
+                    err = math.log(value(self.m_obj))
                     print(self.popt[pname])
                     biter += 1
                     # if midpoint infeasible, continue search inward
@@ -471,12 +569,6 @@ class PLEpy:
                     # if midpoint under CL, continue search outward
                     else:
                         x_in = float(x_mid)
-                    if direct:
-                        x_high = x_out
-                        x_low = x_in
-                    else:
-                        x_high = x_in
-                        x_low = x_out
                 pCI = sigfig(x_mid, acc)
                 print('%s CI of %f found!' % (puc, pCI))
         # reset parameter
@@ -488,7 +580,27 @@ class PLEpy:
         print(self.popt[pname])
         return pCI
 
-    def get_clims(self, pnames='all', alpha: float=0.05, acc: int=3):
+    def _search_clone(self):
+        # copy of this estimator on a cloned model with its own solver
+        # instance, so parallel bound searches do not share mutable state
+        sub = copy.copy(self)
+        sub.m = self.m.clone()
+        opt = SolverFactory(self.sname)
+        opt.options = dict(self.solver.options)
+        sub.solver = opt
+        sub.plist = {p: sub.m.find_component(p) for p in self.pnames}
+        sub.m_obj = sub.m.find_component(self.m_obj.name)
+        return sub
+
+    def _bsearch_task(self, task, clevel: float, acc: int) -> float:
+        # run a single bound search on a cloned model (worker-side helper
+        # for parallel get_clims)
+        pname, direct, idx = task
+        sub = self._search_clone()
+        return sub.bsearch(pname, clevel, acc, direct=direct, idx=idx)
+
+    def get_clims(self, pnames='all', alpha: float=0.05, acc: int=3,
+                  client=None, nthreads=None):
         """Get confidence limits of parameters
         Keywords
         --------
@@ -499,6 +611,15 @@ class PLEpy:
             confidence level, by default 0.05
         acc : int, optional
             accuracy in terms of significant figures, by default 3
+        client : dask.distributed.Client, optional
+            if provided, the independent bound searches (upper & lower for
+            each parameter) are submitted to its workers in parallel, each
+            on a cloned model, by default None (search sequentially)
+        nthreads : int, optional
+            if no client is given, run the searches from a thread pool of
+            this size instead; each thread gets its own cloned model and
+            solver subprocess, so the solves themselves overlap, by
+            default None (search sequentially)
         """
         if isinstance(pnames, str):
             if pnames == 'all':
@@ -513,25 +634,58 @@ class PLEpy:
         # as self.popt
         parub = copy.deepcopy(dict(self.popt))
         parlb = copy.deepcopy(dict(self.popt))
-        # Get upper & lower confidence limits
-        for pname in pnames:
-            # for indexed variables
-            if self.pindexed[pname]:
-                f = 0
-                print(f)
-                for idx in self.pidx[pname]:
-                    parlb[pname][idx] = self.bsearch(pname, clevel, acc,
-                                                     direct=0, idx=idx)
-                    print(parlb)
-                    parub[pname][idx] = self.bsearch(pname, clevel, acc,
-                                                     direct=1, idx=idx)
-                    print(parub)
-                    print(self.popt)
-                    f += 1
-            # for unindexed variables
+        if client is not None or nthreads:
+            # build list of independent (parameter, direction, index) search
+            # tasks and farm them out to Dask workers or a local thread pool
+            tasks = []
+            for pname in pnames:
+                if self.pindexed[pname]:
+                    for idx in self.pidx[pname]:
+                        tasks.append((pname, 0, idx))
+                        tasks.append((pname, 1, idx))
+                else:
+                    tasks.append((pname, 0, None))
+                    tasks.append((pname, 1, None))
+            if client is not None:
+                futures = [client.submit(self._bsearch_task, task, clevel,
+                                         acc)
+                           for task in tasks]
+                results = client.gather(futures)
             else:
-                parlb[pname] = self.bsearch(pname, clevel, acc, direct=0)
-                parub[pname] = self.bsearch(pname, clevel, acc, direct=1)
+                # threads suffice here: each task clones the model and the
+                # solver runs as a subprocess, so solves overlap while only
+                # the Pyomo driver code contends for the GIL
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=nthreads) as pool:
+                    results = list(pool.map(
+                        lambda task: self._bsearch_task(task, clevel, acc),
+                        tasks))
+            for (pname, direct, idx), pCI in zip(tasks, results):
+                bdict = parub if direct else parlb
+                if idx is None:
+                    bdict[pname] = pCI
+                else:
+                    bdict[pname][idx] = pCI
+        else:
+            # Get upper & lower confidence limits
+            for pname in pnames:
+                # for indexed variables
+                if self.pindexed[pname]:
+                    f = 0
+                    print(f)
+                    for idx in self.pidx[pname]:
+                        parlb[pname][idx] = self.bsearch(pname, clevel, acc,
+                                                         direct=0, idx=idx)
+                        print(parlb)
+                        parub[pname][idx] = self.bsearch(pname, clevel, acc,
+                                                         direct=1, idx=idx)
+                        print(parub)
+                        print(self.popt)
+                        f += 1
+                # for unindexed variables
+                else:
+                    parlb[pname] = self.bsearch(pname, clevel, acc, direct=0)
+                    parub[pname] = self.bsearch(pname, clevel, acc, direct=1)
         self.parub = parub
         self.parlb = parlb
 
@@ -554,6 +708,106 @@ class PLEpy:
         with open(filename, 'w') as f:
             json.dump(sv_dict, f)
 
+    def to_npz(self, filename):
+        """Save results to a compressed NumPy archive
+
+        Numeric profile data is stored as float64 arrays (roughly 10x
+        smaller than JSON and with no float-to-decimal round trip);
+        scalar attributes travel as a JSON string inside the same
+        archive. Profiles of indexed parameters (or with indexed
+        covariates) fall back to the JSON string form.
+
+        Args
+        ----
+        filename : str or path
+            location to save .npz archive
+        """
+        atts = ['pnames', 'indices', 'obj', 'pindexed', 'pidx', 'popt',
+                'pbounds', 'parlb', 'parub', 'clevel']
+        meta = {}
+        for att in atts:
+            try:
+                sv_var = getattr(self, att)
+                if isinstance(sv_var, dict):
+                    sv_var = recur_to_json(copy.deepcopy(sv_var))
+                meta[att] = sv_var
+            except AttributeError:
+                print("Attribute '%s' does not exist. Skipping." % (att))
+        arrays = {}
+        meta['PLdict_json'] = {}
+        try:
+            PLdict = self.PLdict
+        except AttributeError:
+            PLdict = {}
+            print("Attribute 'PLdict' does not exist. Skipping.")
+        for pname, prof in PLdict.items():
+            pts = list(prof.values())
+            flat = pts and all(
+                not isinstance(v, dict) for d in pts for v in d.values())
+            if not flat:
+                # indexed parameter (or indexed covariates): keep the
+                # nested dict form
+                meta['PLdict_json'][pname] = recur_to_json(
+                    copy.deepcopy(prof))
+                continue
+            npts = len(pts)
+            arrays[pname + '::x'] = np.fromiter(
+                (float(x) for x in prof.keys()), np.float64, count=npts)
+            arrays[pname + '::obj'] = np.fromiter(
+                (d['obj'] for d in pts), np.float64, count=npts)
+            arrays[pname + '::flag'] = np.fromiter(
+                (d['flag'] for d in pts), np.int64, count=npts)
+            for p in pts[0]:
+                if p not in ('obj', 'flag'):
+                    arrays[pname + '::par::' + p] = np.fromiter(
+                        (d[p] for d in pts), np.float64, count=npts)
+        np.savez_compressed(filename, meta=json.dumps(meta), **arrays)
+
+    def load_npz(self, filename):
+        """Load results saved with to_npz"""
+        from plepy.helper import recur_load_json
+
+        atts = ['pidx', 'popt', 'pbounds', 'parlb', 'parub', 'clevel']
+        with np.load(filename) as dat:
+            meta = json.loads(dat['meta'].item())
+            for att in atts:
+                try:
+                    sv_var = meta[att]
+                    if att == 'pidx':
+                        sv_var = {k: [tuple(i) for i in sv_var[k]]
+                                  for k in sv_var.keys()}
+                    elif att == 'clevel':
+                        pass
+                    else:
+                        sv_var = recur_load_json(sv_var)
+                    setattr(self, att, sv_var)
+                except KeyError:
+                    print("Attribute '%s' not yet defined." % (att))
+            # rebuild profiles from their array groups (keyed off the saved
+            # parameter names so covariate arrays are never mistaken for a
+            # group of their own)
+            PLdict = {}
+            for pname in meta.get('pnames', []):
+                if pname + '::x' not in dat.files:
+                    continue
+                xs = dat[pname + '::x']
+                objs = dat[pname + '::obj']
+                flags = dat[pname + '::flag']
+                covs = {k.split('::par::', 1)[1]: dat[k] for k in dat.files
+                        if k.startswith(pname + '::par::')}
+                prof = {}
+                for i in range(xs.size):
+                    xdict = {'flag': int(flags[i]), 'obj': float(objs[i])}
+                    for p in covs:
+                        xdict[p] = float(covs[p][i])
+                    prof[float(xs[i])] = xdict
+                PLdict[pname] = prof
+            # profiles that were stored in nested JSON form
+            for pname, prof in meta.get('PLdict_json', {}).items():
+                PLdict[pname] = recur_load_json(prof)
+        if PLdict:
+            self.PLdict = PLdict
+
     def load_json(self, filename):
         from plepy.helper import recur_load_json
         # load PL data from a json file
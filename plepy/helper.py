@@ -1,8 +1,12 @@
+import math
+
 import numpy as np
 
 
 def sigfig(n, sf: int):
-    mag = int(np.floor(np.log10(n)))
+    # math.* is used over np.* because n is a scalar and this runs twice
+    # per bsearch iteration: plain C calls skip the ufunc dispatch
+    mag = math.floor(math.log10(n))
     rf = sf - mag - 1
     return round(n, rf)
 
@@ -134,7 +138,9 @@ def plot_PL(PLdict, clevel: float, pnames='all', covar='all', join: bool=False,
     npars = len(pnames)
     ncovs = len(covar)
     if len(covar) > len(cpal):
-        nreps = np.ceil(len(covar)/len(cpal))
+        # ceiling division keeps nreps an int (np.ceil yields a float,
+        # which can't repeat a list)
+        nreps = -(-len(covar)//len(cpal))
         cpal = nreps*cpal
     cmap = {covar[i]: cpal[i] for i in range(len(covar))}
     for k in list(pidx.keys()):
@@ -150,7 +156,7 @@ def plot_PL(PLdict, clevel: float, pnames='all', covar='all', join: bool=False,
     assert npars != 0
     assert jmax > 0
     if join:
-        nfig = int(np.ceil(npars/jmax))
+        nfig = -(-npars//jmax)
         # if the number of profiled parameters is not divisible by the maximum
         # number of subplot columns (jmax), make the first figure generated
         # contain the remainder
@@ -181,18 +187,23 @@ def plot_PL(PLdict, clevel: float, pnames='all', covar='all', join: bool=False,
             if key in list(pidx.keys()):
                 idx = True
                 ikey = pidx[key][b]
-                x = sorted([float(j) for j in PLdict[key][ikey].keys()])
-                xstr = [str(j) for j in x]
-                y1 = [PLdict[key][ikey][j]['obj'] for j in xstr]
+                pardict = PLdict[key][ikey]
                 b += 1
                 if b == len(pidx[key]):
                     b = 0
             else:
                 idx = False
-                x = sorted([float(j) for j in PLdict[key].keys()])
-                xstr = [str(j) for j in x]
-                # plot objective value in first row
-                y1 = [PLdict[key][j]['obj'] for j in xstr]
+                pardict = PLdict[key]
+            # sort discretization points with a single vectorized argsort
+            # rather than a Python sort over str/float conversions
+            pkeys = list(pardict.keys())
+            xall = np.array(pkeys, dtype=np.float64)
+            order = np.argsort(xall)
+            xstr = [pkeys[j] for j in order]
+            x = xall[order]
+            # plot objective value in first row
+            y1 = np.fromiter((pardict[j]['obj'] for j in xstr), np.float64,
+                             count=len(xstr))
             axs[d][0, i].plot(x, y1, ls='None', marker='o')
             axs[d][0, i].plot(x, len(x)*[clevel], color='red')
             # plot other parameter values in second row
@@ -201,26 +212,32 @@ def plot_PL(PLdict, clevel: float, pnames='all', covar='all', join: bool=False,
                     if p in list(pidx.keys()):
                         for a in pidx[p]:
                             if not (p == key and a == ikey):
-                                lbl = ''.join([p, '[', str(a), ']'])
-                                yi = [PLdict[key][ikey][j][p][a] for j in xstr]
+                                lbl = f'{p}[{a}]'
+                                yi = np.fromiter(
+                                    (pardict[j][p][a] for j in xstr),
+                                    np.float64, count=len(xstr))
                                 axs[d][1, i].plot(x, yi, ls='None', marker='o',
                                                   label=lbl, color=cmap[p][a])
                     else:
-                        yi = [PLdict[key][ikey][j][p] for j in xstr]
+                        yi = np.fromiter((pardict[j][p] for j in xstr),
+                                         np.float64, count=len(xstr))
                         axs[d][1, i].plot(x, yi, ls='None', marker='o',
                                           label=p, color=cmap[p])
-                klbl = ''.join([key, '[', str(ikey), ']'])
+                klbl = f'{key}[{ikey}]'
                 axs[d][1, i].set_xlabel(klbl)
             else:
                 for p in [p for p in covar if p != key]:
                     if p in list(pidx.keys()):
                         for a in pidx[p]:
-                            lbl = ''.join([p, '[', str(a), ']'])
-                            yi = [PLdict[key][j][p][a] for j in xstr]
+                            lbl = f'{p}[{a}]'
+                            yi = np.fromiter(
+                                (pardict[j][p][a] for j in xstr),
+                                np.float64, count=len(xstr))
                             axs[d][1, i].plot(x, yi, ls='None', marker='o',
                                               label=lbl, color=cmap[p][a])
                     else:
-                        yi = [PLdict[key][j][p] for j in xstr]
+                        yi = np.fromiter((pardict[j][p] for j in xstr),
+                                         np.float64, count=len(xstr))
                         axs[d][1, i].plot(x, yi, ls='None', marker='o',
                                           label=p, color=cmap[p])
                 axs[d][1, i].set_xlabel(key)
@@ -245,7 +262,91 @@ def plot_PL(PLdict, clevel: float, pnames='all', covar='all', join: bool=False,
         return figs, axs
     elif disp == 'save':
         for i in range(nfig):
-            figs[i].savefig('_'.join([fprefix, str(i)]), **dispkwds)
+            figs[i].savefig(f'{fprefix}_{i}', **dispkwds)
         return figs, axs
     else:
         return figs, axs
+
+
+def ebarplots(popt, parlb, parub, disp: str='show', fprefix: str='tmp_ebar',
+              **dispkwds):
+    """Plot optimal parameter values with error bars spanning their
+    confidence limits
+
+    Args
+    ----
+    popt : dict
+        optimal parameter values keyed by parameter name (indexed
+        parameters hold a dict keyed by index)
+    parlb : dict
+        lower confidence limits, same structure as popt
+    parub : dict
+        upper confidence limits, same structure as popt
+
+    Keywords
+    --------
+    disp: str, optional
+        how to display generated figure, 'show' will run command
+        fig.show(), 'save' will save the figure using the filename
+        specified in fprefix, 'None' will simply return the handles, by
+        default 'show'
+    fprefix: str, optional
+        filename to give figure if disp='save', by default 'tmp_ebar'
+    **dispkwds: optional
+        Keywords to pass to display function (either fig.show() or
+        fig.savefig())
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # flatten indexed parameters into one entry per index, then stack
+    # values into arrays so the error computation is two vector
+    # subtractions instead of one pair per parameter
+    names = []
+    opt = []
+    lb = []
+    ub = []
+    for p in popt.keys():
+        if isinstance(popt[p], dict):
+            for k in popt[p].keys():
+                names.append(f'{p}[{k}]')
+                opt.append(popt[p][k])
+                lb.append(parlb[p][k])
+                ub.append(parub[p][k])
+        else:
+            names.append(p)
+            opt.append(popt[p])
+            lb.append(parlb[p])
+            ub.append(parub[p])
+    opt = np.asarray(opt, dtype=np.float64)
+    perr = np.vstack((opt - np.asarray(lb, dtype=np.float64),
+                      np.asarray(ub, dtype=np.float64) - opt))
+
+    nPars = len(names)
+    assert nPars != 0
+    cpal = sns.color_palette("deep")
+    nrow = max(1, nPars//3)
+    ncol = -(-nPars//nrow)
+    fig, axs = plt.subplots(nrow, ncol, figsize=(3*ncol, 3*nrow),
+                            squeeze=False)
+    for i in range(nPars):
+        ax = axs[i//ncol, i % ncol]
+        ax.bar([0], [opt[i]], yerr=perr[:, i:i+1], capsize=6,
+               color=cpal[i % len(cpal)])
+        ax.set_xticks([0])
+        ax.set_xticklabels([names[i]])
+    # hide any unused grid cells
+    for i in range(nPars, nrow*ncol):
+        axs[i//ncol, i % ncol].set_axis_off()
+    axs[0, 0].set_ylabel('Parameter Value')
+    sns.despine(fig)
+    fig.tight_layout()
+    # display generated plot and/or return its handles
+    if disp == 'show':
+        fig.show(**dispkwds)
+        return fig, axs
+    elif disp == 'save':
+        fig.savefig(fprefix, **dispkwds)
+        return fig, axs
+    else:
+        return fig, axs